@@ -16,6 +16,11 @@ import six
 COMPILE_SCRIPT = "pyc/compile_bytecode.py"
 COMPILE_ERROR_RE = re.compile(r"^(.*) \((.*), line (\d+)\)$")
 
+# Compiling spawns an external process, so we remember the pyc data for every
+# (src, filename, python_version, python_exe, mode) we've already compiled.
+# The same snippets, e.g. string annotations, are often compiled many times.
+_cached_pyc_strings = {}
+
 
 class CompileError(Exception):
   """A compilation error."""
@@ -40,6 +45,7 @@ def compile_src_string_to_pyc_string(src, filename, python_version, python_exe,
   This may use py_compile if the src is for the same version as we're running,
   or else it spawns an external process to produce a .pyc file. The generated
   bytecode (.pyc file) is read and both it and any temporary files are deleted.
+  Successful compilations are cached for the lifetime of the process.
 
   Args:
     src: Python sourcecode
@@ -58,6 +64,9 @@ def compile_src_string_to_pyc_string(src, filename, python_version, python_exe,
     CompileError: If we find a syntax error in the file.
     IOError: If our compile script failed.
   """
+  key = (src, filename, python_version, python_exe, mode)
+  if key in _cached_pyc_strings:
+    return _cached_pyc_strings[key]
   tempfile_options = {"mode": "w", "suffix": ".py", "delete": False}
   if six.PY3:
     tempfile_options.update({"encoding": "utf-8"})
@@ -91,6 +100,7 @@ def compile_src_string_to_pyc_string(src, filename, python_version, python_exe,
     os.unlink(fi.name)
   first_byte = six.indexbytes(bytecode, 0)
   if first_byte == 0:  # compile OK
+    _cached_pyc_strings[key] = bytecode[1:]
     return bytecode[1:]
   elif first_byte == 1:  # compile error
     raise CompileError(bytecode[1:].decode("utf-8"))
@@ -38,6 +38,15 @@ class TestPyc(unittest.TestCase):
     self.assertIn("foobar", code.co_names)
     self.assertEqual(self.python_version, code.python_version)
 
+  def test_compile_cached(self):
+    pyc_data1 = pyc.compile_src_string_to_pyc_string(
+        "x = 42", filename="test_input.py", python_version=self.python_version,
+        python_exe=None)
+    pyc_data2 = pyc.compile_src_string_to_pyc_string(
+        "x = 42", filename="test_input.py", python_version=self.python_version,
+        python_exe=None)
+    self.assertIs(pyc_data1, pyc_data2)
+
   def test_compile_utf8(self):
     src = "foobar = \"abc□def\""
     if six.PY2:
@@ -419,6 +419,7 @@ class ClassType(node.Node('name: str'), Type):
 
 class LateType(node.Node('name: str'), Type):
   """A type we have yet to resolve."""
+  __slots__ = ()
 
   def __str__(self):
     return self.name
@@ -508,10 +509,12 @@ class _SetOfTypes(node.Node('type_list: tuple[{Type}]'), Type):
 
 class UnionType(_SetOfTypes):
   """A union type that contains all types in self.type_list."""
+  __slots__ = ()
 
 
 class IntersectionType(_SetOfTypes):
   """An intersection type."""
+  __slots__ = ()
 
 
 class GenericType(node.Node('base_type: NamedType or ClassType or LateType',
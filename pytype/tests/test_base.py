@@ -1,17 +1,23 @@
 """Common methods for tests of analyze.py."""
 
 import collections
+import hashlib
 import logging
+import os
 import re
+import shutil
 import six
 import sys
 import textwrap
 
+from pytype import __version__
 from pytype import analyze
 from pytype import config
 from pytype import directors
 from pytype import errors
+from pytype import file_utils
 from pytype import load_pytd
+from pytype import pytype_source_utils
 from pytype import utils
 from pytype.pyi import parser
 from pytype.pytd import optimize
@@ -20,6 +26,7 @@ from pytype.pytd import pytd_utils
 from pytype.pytd import serialize_ast
 from pytype.pytd import visitors
 from pytype.tests import test_utils
+from six.moves import cPickle
 
 import unittest
 
@@ -34,6 +41,35 @@ CAPTURE_STDOUT = ("-s" not in sys.argv)
 skip = unittest.skip
 
 
+# Memoized results of BaseTest.Infer. Many test snippets are analyzed repeatedly
+# (the same source under the same options), so we keep the optimized and
+# canonically ordered units around for the lifetime of the test process.
+_INFER_CACHE = {}
+
+# If set, the output of BaseTest.Infer is additionally cached on disk, in this
+# directory, so that it survives across test processes. Entries live in
+# $PYTYPE_TEST_CACHE_DIR/pytype_infer/<fingerprint>, where the fingerprint
+# reflects the state of the pytype source tree (see _GetSourceTreeFingerprint),
+# so editing pytype or typeshed invalidates them.
+_DISK_CACHE_DIR = os.environ.get("PYTYPE_TEST_CACHE_DIR")
+
+# Memoized result of _GetSourceTreeFingerprint.
+_source_tree_fingerprint = None
+
+# Maps each disk cache directory to its subdirectory for the current source
+# tree. See _GetDiskCacheSubdir.
+_DISK_CACHE_SUBDIRS = {}
+
+# Loaders for configurations without a pythonpath or imports map. They only ever
+# load builtins and typeshed stubs, so all test classes in the process share
+# them. See BaseTest.loader.
+_SHARED_LOADERS = {}
+
+# Memoized results of BaseTest._ParsePytd, keyed on the dedented pytd source and
+# the target Python version, so that expected output is only parsed once.
+_PARSED_PYTD_CACHE = {}
+
+
 # Pytype offers a Python 2.7 interpreter with type annotations backported as a
 # __future__ import (see pytype/patches/python_2_7_type_annotations.diff).
 _ANNOTATIONS_IMPORT = "from __future__ import google_type_annotations"
@@ -97,14 +133,104 @@ def _MatchLoaderConfig(options, loader):
   return True
 
 
+def _GetLoaderConfig(options):
+  """Get the part of |options| that determines the configuration of a loader."""
+  loader_config = [options.use_pickled_files]
+  for _, opt in sorted(load_pytd.LOADER_ATTR_TO_CONFIG_OPTION_MAP.items()):
+    value = getattr(options, opt)
+    # pythonpath may be a list, and imports_map a dict. Neither is hashable.
+    loader_config.append(
+        repr(value) if isinstance(value, (dict, list)) else value)
+  return tuple(loader_config)
+
+
+def _GetSourceTreeFingerprint():
+  """Fingerprint the pytype version, source tree and typeshed.
+
+  Returns:
+    A string that changes whenever a file in the pytype source tree (which
+    includes typeshed) is added, removed or modified. Files under pytype/tests/
+    don't affect inference, so they are left out, except for this file, which
+    decides what Infer stores.
+  """
+  global _source_tree_fingerprint
+  if _source_tree_fingerprint is None:
+    m = hashlib.sha256(__version__.__version__.encode("utf-8"))
+    roots = [pytype_source_utils.pytype_source_dir()]
+    if os.getenv("TYPESHED_HOME"):
+      roots.append(os.getenv("TYPESHED_HOME"))
+    tests_dir = os.path.realpath(os.path.dirname(__file__))
+    cache_dir = os.path.realpath(_DISK_CACHE_DIR)
+    # __file__ may point to the bytecode, which changes as tests run.
+    paths = [os.path.splitext(os.path.abspath(__file__))[0] + ".py"]
+    for root in roots:
+      for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
+        # Skip the tests, as well as bytecode and the cache itself, which change
+        # as tests run.
+        dirnames[:] = sorted(
+            d for d in dirnames if d != "__pycache__" and
+            os.path.realpath(os.path.join(dirpath, d)) not in (
+                tests_dir, cache_dir))
+        paths.extend(os.path.join(dirpath, filename)
+                     for filename in sorted(filenames)
+                     if not filename.endswith(".pyc"))
+    for path in paths:
+      stat = os.stat(path)
+      m.update(("%s %d %r\n" % (
+          path, stat.st_size, stat.st_mtime)).encode("utf-8"))
+    _source_tree_fingerprint = m.hexdigest()
+  return _source_tree_fingerprint
+
+
+def _GetDiskCacheSubdir():
+  """Get the subdirectory of _DISK_CACHE_DIR for the current source tree.
+
+  The first time this is called for a cache directory, we delete the entries of
+  other source trees. We only touch directories that we could have created
+  ourselves, i.e. those inside pytype_infer/ that are named like a fingerprint,
+  since _DISK_CACHE_DIR may well be shared with other tools.
+
+  Returns:
+    The path of the subdirectory.
+  """
+  if _DISK_CACHE_DIR not in _DISK_CACHE_SUBDIRS:
+    fingerprint = _GetSourceTreeFingerprint()
+    namespace = os.path.join(_DISK_CACHE_DIR, "pytype_infer")
+    if os.path.isdir(namespace):
+      for name in os.listdir(namespace):
+        path = os.path.join(namespace, name)
+        if (name != fingerprint and re.match(r"[0-9a-f]{64}$", name) and
+            os.path.isdir(path)):
+          # Other test processes may be deleting the same directory.
+          shutil.rmtree(path, ignore_errors=True)
+    _DISK_CACHE_SUBDIRS[_DISK_CACHE_DIR] = os.path.join(namespace, fingerprint)
+  return _DISK_CACHE_SUBDIRS[_DISK_CACHE_DIR]
+
+
+class _UnlinkTypes(visitors.Visitor):
+  """Replace ClassType and FunctionType nodes with unresolved copies.
+
+  serialize_ast.StoreAst clears the pointers of these nodes in place, so we
+  run this visitor first to leave the original tree intact.
+  """
+
+  def VisitClassType(self, node):
+    return pytd.ClassType(node.name)
+
+  def VisitFunctionType(self, node):
+    return pytd.FunctionType(node.name)
+
+
 class BaseTest(unittest.TestCase):
   """Base class for implementing tests that check PyTD output."""
 
   @classmethod
   def setUpClass(cls):
     super(BaseTest, cls).setUpClass()
-    # We use class-wide loader to avoid creating a new loader for every test
-    # method if not required.
+    # We use a class-wide loader to avoid creating a new loader for every test
+    # method if not required. This is only used for configurations with a
+    # pythonpath or imports map; all others share the loaders in
+    # _SHARED_LOADERS.
     cls._loader = None
 
     def t(name):  # pylint: disable=invalid-name
@@ -175,11 +301,22 @@ class BaseTest(unittest.TestCase):
 
   @property
   def loader(self):
-    if not _MatchLoaderConfig(self.options, self._loader):
-      # Create a new loader only if the configuration in the current options
-      # does not match the configuration in the current loader.
-      self._loader = load_pytd.create_loader(self.options)
-    return self._loader
+    if self.options.pythonpath or self.options.imports_map:
+      # These loaders read test-specific files (and tests sometimes modify them
+      # in place), so we keep only the most recent one, and check it against
+      # the loader's own attributes.
+      if not _MatchLoaderConfig(self.options, self._loader):
+        # Create a new loader only if the configuration in the current options
+        # does not match the configuration in the current loader.
+        self._loader = load_pytd.create_loader(self.options)
+      return self._loader
+    # Builtins-only loaders are shared by all tests, one per configuration. Test
+    # methods alternate between target Python versions (see main()), so a
+    # single slot would be refilled for almost every method.
+    key = _GetLoaderConfig(self.options)
+    if key not in _SHARED_LOADERS:
+      _SHARED_LOADERS[key] = load_pytd.create_loader(self.options)
+    return _SHARED_LOADERS[key]
 
   def ConfigureOptions(self, **kwargs):
     assert "python_version" not in kwargs, (
@@ -388,13 +525,29 @@ class BaseTest(unittest.TestCase):
   def Infer(self, srccode, pythonpath=(), deep=True,
             report_errors=True, analyze_annotated=True, pickle=False,
             module_name=None, **kwargs):
-    types, builtins_pytd = self._InferAndVerify(
-        textwrap.dedent(srccode), pythonpath=pythonpath, deep=deep,
-        analyze_annotated=analyze_annotated, module_name=module_name,
-        report_errors=report_errors, **kwargs)
-    types = optimize.Optimize(types, builtins_pytd, lossy=False, use_abcs=False,
-                              max_union=7, remove_mutable=False)
-    types = pytd_utils.CanonicalOrdering(types)
+    src = textwrap.dedent(srccode)
+    self._ConfigureInferOptions(
+        pythonpath, module_name, analyze_annotated,
+        kwargs.get("imports_map"), kwargs.get("quick", False))
+    cache_key = self._InferCacheKey(src, report_errors, dict(kwargs, deep=deep))
+    if cache_key in _INFER_CACHE:
+      types = _INFER_CACHE[cache_key]
+    else:
+      cache_file = self._GetDiskCacheFile(cache_key)
+      types = cache_file and self._LoadFromDiskCache(cache_file)
+      if not types:
+        types, builtins_pytd = self._InferAndVerify(
+            src, pythonpath=pythonpath, deep=deep,
+            analyze_annotated=analyze_annotated, module_name=module_name,
+            report_errors=report_errors, **kwargs)
+        types = optimize.Optimize(types, builtins_pytd, lossy=False,
+                                  use_abcs=False, max_union=7,
+                                  remove_mutable=False)
+        types = pytd_utils.CanonicalOrdering(types)
+        if cache_file:
+          self._StoreInDiskCache(cache_file, types)
+      if cache_key is not None:
+        _INFER_CACHE[cache_key] = types
     if pickle:
       return self._Pickle(types, module_name)
     else:
@@ -423,10 +576,8 @@ class BaseTest(unittest.TestCase):
     Returns:
       A pytd.TypeDeclUnit
     """
-    self.ConfigureOptions(
-        module_name=module_name, quick=quick, use_pickled_files=True,
-        pythonpath=[""] if (not pythonpath and imports_map) else pythonpath,
-        imports_map=imports_map, analyze_annotated=analyze_annotated)
+    self._ConfigureInferOptions(
+        pythonpath, module_name, analyze_annotated, imports_map, quick)
     errorlog = errors.ErrorLog()
     unit, builtins_pytd = analyze.infer_types(
         src, errorlog, self.options, loader=self.loader, **kwargs)
@@ -436,10 +587,75 @@ class BaseTest(unittest.TestCase):
       self.fail("Inferencer found %d errors" % len(errorlog))
     return unit, builtins_pytd
 
-  def assertTypesMatchPytd(self, ty, pytd_src):
-    """Parses pytd_src and compares with ty."""
-    pytd_tree = parser.parse_string(
-        textwrap.dedent(pytd_src), python_version=self.python_version)
+  def _ConfigureInferOptions(self, pythonpath, module_name, analyze_annotated,
+                             imports_map=None, quick=False):
+    self.ConfigureOptions(
+        module_name=module_name, quick=quick, use_pickled_files=True,
+        pythonpath=[""] if (not pythonpath and imports_map) else pythonpath,
+        imports_map=imports_map, analyze_annotated=analyze_annotated)
+
+  def _GetDiskCacheFile(self, cache_key):
+    """Get the file in which Infer caches its result, or None if uncached."""
+    if not _DISK_CACHE_DIR or cache_key is None:
+      return None
+    key = hashlib.sha256(repr(cache_key).encode("utf-8")).hexdigest()
+    return os.path.join(_GetDiskCacheSubdir(), key + ".pickled")
+
+  def _LoadFromDiskCache(self, filename):
+    """Load a cached ast and resolve it against our loader, if possible."""
+    if not os.path.exists(filename):
+      return None
+    try:
+      serializable_ast = pytd_utils.LoadPickle(filename)
+      module_map = {}
+      for dependency, _ in serializable_ast.dependencies:
+        if dependency != serializable_ast.ast.name:
+          module_map[dependency] = self.loader.import_name(dependency)
+      if not all(module_map.values()):
+        return None
+      return serialize_ast.ProcessAst(serializable_ast, module_map)
+    except (IOError, EOFError, cPickle.UnpicklingError,
+            load_pytd.BadDependencyError,
+            serialize_ast.UnrestorableDependencyError) as e:
+      log.warning("Ignoring bad cache entry %s: %s", filename, e)
+      return None
+
+  def _StoreInDiskCache(self, filename, ast):
+    # serialize_ast.StoreAst renames "foo.__init__" to "foo", so a cache hit
+    # would return a differently named unit.
+    if not ast.name or ast.name.endswith(".__init__"):
+      return
+    file_utils.makedirs(os.path.dirname(filename))
+    # Write to a temporary file first, since test processes run in parallel.
+    tmp_filename = "%s.%d" % (filename, os.getpid())
+    serialize_ast.StoreAst(ast.Visit(_UnlinkTypes()), tmp_filename)
+    os.rename(tmp_filename, filename)
+
+  def _InferCacheKey(self, src, report_errors, kwargs):
+    """Compute the key under which Infer memoizes its result.
+
+    Args:
+      src: The (dedented) source code of the module.
+      report_errors: Whether errors fail the test.
+      kwargs: Keyword parameters passed through to the type inferencer.
+
+    Returns:
+      A hashable key, or None if the result must not be cached. We don't cache
+      analyses that read from a pythonpath or an imports map, since the
+      contents of those files are not part of the key.
+    """
+    if self.options.pythonpath or self.options.imports_map:
+      return None
+    return (src, report_errors, repr(self.options),
+            repr(sorted(kwargs.items())))
+
+  def _ParsePytd(self, pytd_src):
+    """Parses pytd_src into a canonically ordered tree of NamedTypes."""
+    src = textwrap.dedent(pytd_src)
+    key = (src, self.python_version)
+    if key in _PARSED_PYTD_CACHE:
+      return _PARSED_PYTD_CACHE[key]
+    pytd_tree = parser.parse_string(src, python_version=self.python_version)
     pytd_tree = pytd_tree.Visit(visitors.LookupBuiltins(
         self.loader.builtins, full_names=False))
     pytd_tree = pytd_tree.Visit(visitors.LookupLocalTypes())
@@ -448,11 +664,22 @@ class BaseTest(unittest.TestCase):
     pytd_tree = pytd_tree.Visit(
         visitors.CanonicalOrderingVisitor(sort_signatures=True))
     pytd_tree.Visit(visitors.VerifyVisitor())
+    _PARSED_PYTD_CACHE[key] = pytd_tree
+    return pytd_tree
+
+  def assertTypesMatchPytd(self, ty, pytd_src):
+    """Parses pytd_src and compares with ty."""
+    pytd_tree = self._ParsePytd(pytd_src)
     ty = ty.Visit(visitors.ClassTypeToNamedType())
     ty = ty.Visit(visitors.AdjustSelf())
     ty = ty.Visit(visitors.CanonicalOrderingVisitor(sort_signatures=True))
     ty.Visit(visitors.VerifyVisitor())
 
+    if pytd_tree.ASTeq(ty) and not log.isEnabledFor(logging.INFO):
+      # Both trees are canonically ordered, so equal trees print the same, and
+      # we can skip printing them for the textual comparison below.
+      return
+
     ty_src = pytd.Print(ty) + "\n"
     pytd_tree_src = pytd.Print(pytd_tree) + "\n"
 
@@ -0,0 +1,713 @@
+"""Tests for classes.
+
+File 1/2. Split into parts to enable better test parallelism.
+"""
+
+from pytype.tests import test_base
+from pytype.tests import test_utils
+
+
+class ClassesTest(test_base.TargetIndependentTest):
+  """Tests for classes."""
+
+  def testMakeClass(self):
+    ty = self.Infer("""
+      class Thing(tuple):
+        def __init__(self, x):
+          self.x = x
+      def f():
+        x = Thing(1)
+        x.y = 3
+        return x
+    """)
+    self.assertTypesMatchPytd(ty, """
+    from typing import Any
+    class Thing(tuple):
+      x = ...  # type: Any
+      y = ...  # type: int
+      def __init__(self, x) -> NoneType: ...
+    def f() -> Thing: ...
+    """)
+
+  def testLoadClassderef(self):
+    """Exercises the Python 3 LOAD_CLASSDEREF opcode.
+
+    Serves as a simple test for Python 2.
+    """
+    self.Check("""
+      class A(object):
+        def foo(self):
+          x = 10
+          class B(object):
+            y = str(x)
+    """)
+
+  def testClassDecorator(self):
+    ty = self.Infer("""
+      @__any_object__
+      class MyClass(object):
+        def method(self, response):
+          pass
+      def f():
+        return MyClass()
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Any
+      MyClass = ...  # type: Any
+      def f() -> ?
+    """)
+
+  def testClassName(self):
+    ty = self.Infer("""
+      class MyClass(object):
+        def __init__(self, name):
+          pass
+      def f():
+        factory = MyClass
+        return factory("name")
+      f()
+    """, deep=False, show_library_calls=True)
+    self.assertTypesMatchPytd(ty, """
+    class MyClass(object):
+      def __init__(self, name: str) -> NoneType
+
+    def f() -> MyClass
+    """)
+
+  def testInheritFromUnknown(self):
+    ty = self.Infer("""
+      class A(__any_object__):
+        pass
+    """, deep=False)
+    self.assertTypesMatchPytd(ty, """
+    class A(?):
+      pass
+    """)
+
+  def testInheritFromUnknownAndCall(self):
+    ty = self.Infer("""
+      x = __any_object__
+      class A(x):
+        def __init__(self):
+          x.__init__(self)
+    """)
+    self.assertTypesMatchPytd(ty, """
+    x = ...  # type: ?
+    class A(?):
+      def __init__(self) -> NoneType
+    """)
+
+  def testInheritFromUnknownAndSetAttr(self):
+    ty = self.Infer("""
+      class Foo(__any_object__):
+        def __init__(self):
+          setattr(self, "test", True)
+    """)
+    self.assertTypesMatchPytd(ty, """
+    class Foo(?):
+      def __init__(self) -> NoneType
+    """)
+
+  def testInheritFromUnknownAndInitialize(self):
+    ty = self.Infer("""
+      class Foo(object):
+        pass
+      class Bar(Foo, __any_object__):
+        pass
+      x = Bar(duration=0)
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Any
+      class Foo(object):
+        pass
+      class Bar(Foo, Any):
+        pass
+      x = ...  # type: Bar
+    """)
+
+  def testInheritFromUnsolvable(self):
+    d = test_utils.pyi_dir("a.pyi", """
+      from typing import Any
+      def __getattr__(name) -> Any
+    """)
+    ty = self.Infer("""
+      import a
+      class Foo(object):
+        pass
+      class Bar(Foo, a.A):
+        pass
+      x = Bar(duration=0)
+    """, pythonpath=[d])
+    self.assertTypesMatchPytd(ty, """
+      from typing import Any
+      a = ...  # type: module
+      class Foo(object):
+        pass
+      class Bar(Foo, Any):
+        pass
+      x = ...  # type: Bar
+    """)
+
+  def testClassMethod(self):
+    ty = self.Infer("""
+      module = __any_object__
+      class Foo(object):
+        @classmethod
+        def bar(cls):
+          module.bar("", '%Y-%m-%d')
+      def f():
+        return Foo.bar()
+    """)
+    self.assertTypesMatchPytd(ty, """
+    module = ...  # type: ?
+    def f() -> NoneType
+    class Foo(object):
+      @classmethod
+      def bar(cls) -> None: ...
+    """)
+
+  def testInheritFromUnknownAttributes(self):
+    ty = self.Infer("""
+      class Foo(__any_object__):
+        def f(self):
+          self.x = [1]
+          self.y = list(self.x)
+    """)
+    self.assertTypesMatchPytd(ty, """
+    from typing import List
+    class Foo(?):
+      x = ...  # type: List[int, ...]
+      y = ...  # type: List[int, ...]
+      def f(self) -> NoneType
+    """)
+
+  def testInnerClass(self):
+    ty = self.Infer("""
+      def f():
+        class Foo(object):
+          x = 3
+        l = Foo()
+        return l.x
+    """, show_library_calls=True)
+    self.assertTypesMatchPytd(ty, """
+      def f() -> int
+    """)
+
+  def testSuper(self):
+    ty = self.Infer("""
+      class Base(object):
+        def __init__(self, x, y):
+          pass
+      class Foo(Base):
+        def __init__(self, x):
+          super(Foo, self).__init__(x, y='foo')
+    """)
+    self.assertTypesMatchPytd(ty, """
+    class Base(object):
+      def __init__(self, x, y) -> NoneType
+    class Foo(Base):
+      def __init__(self, x) -> NoneType
+    """)
+
+  def testSuperError(self):
+    _, errors = self.InferWithErrors("""\
+      class Base(object):
+        def __init__(self, x, y, z):
+          pass
+      class Foo(Base):
+        def __init__(self, x):
+          super(Foo, self).__init__()
+    """)
+    self.assertErrorLogIs(errors, [(6, "missing-parameter", r"x")])
+
+  def testSuperInInit(self):
+    ty = self.Infer("""
+      class A(object):
+        def __init__(self):
+          self.x = 3
+
+      class B(A):
+        def __init__(self):
+          super(B, self).__init__()
+
+        def get_x(self):
+          return self.x
+    """, show_library_calls=True)
+    self.assertTypesMatchPytd(ty, """
+        class A(object):
+          x = ...  # type: int
+
+        class B(A):
+          # TODO(kramm): optimize this out
+          x = ...  # type: int
+          def get_x(self) -> int
+    """)
+
+  def testSuperDiamond(self):
+    ty = self.Infer("""
+      class A(object):
+        x = 1
+      class B(A):
+        y = 4
+      class C(A):
+        y = "str"
+        z = 3j
+      class D(B, C):
+        def get_x(self):
+          return super(D, self).x
+        def get_y(self):
+          return super(D, self).y
+        def get_z(self):
+          return super(D, self).z
+    """)
+    self.assertTypesMatchPytd(ty, """
+      class A(object):
+          x = ...  # type: int
+      class B(A):
+          y = ...  # type: int
+      class C(A):
+          y = ...  # type: str
+          z = ...  # type: complex
+      class D(B, C):
+          def get_x(self) -> int
+          def get_y(self) -> int
+          def get_z(self) -> complex
+    """)
+
+  def testInheritFromList(self):
+    ty = self.Infer("""
+      class MyList(list):
+        def foo(self):
+          return getattr(self, '__str__')
+    """)
+    self.assertTypesMatchPytd(ty, """
+      class MyList(list):
+        def foo(self) -> ?
+    """)
+
+  def testClassAttr(self):
+    ty = self.Infer("""
+      class Foo(object):
+        pass
+      OtherFoo = Foo().__class__
+      Foo.x = 3
+      OtherFoo.x = "bar"
+    """)
+    self.assertTypesMatchPytd(ty, """
+      class Foo(object):
+        x = ...  # type: str
+      OtherFoo = Foo
+    """)
+
+  def testCallClassAttr(self):
+    ty = self.Infer("""
+      class Flag(object):
+        convert_method = int
+        def convert(self, value):
+          return self.convert_method(value)
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Type
+      class Flag(object):
+        convert_method = ...  # type: Type[int]
+        def convert(self, value) -> int
+    """)
+
+  def testBoundMethod(self):
+    ty = self.Infer("""
+      class Random(object):
+          def seed(self):
+            pass
+
+      _inst = Random()
+      seed = _inst.seed
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Any, Callable
+      class Random(object):
+         def seed(self) -> None: ...
+
+      _inst = ...  # type: Random
+      def seed() -> None: ...
+    """)
+
+  def testMROWithUnsolvables(self):
+    ty = self.Infer("""
+      from nowhere import X, Y  # pytype: disable=import-error
+      class Foo(Y):
+        pass
+      class Bar(X, Foo, Y):
+        pass
+    """)
+    self.assertTypesMatchPytd(ty, """
+      X = ...  # type: ?
+      Y = ...  # type: ?
+      class Foo(?):
+        ...
+      class Bar(?, Foo, ?):
+        ...
+    """)
+
+  def testProperty(self):
+    ty = self.Infer("""
+      class Foo(object):
+        def __init__(self):
+          self._name = "name"
+        def test(self):
+          return self.name
+        name = property(fget=lambda self: self._name)
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Any
+      class Foo(object):
+        _name = ...  # type: str
+        name = ...  # type: Any
+        def test(self) -> str: ...
+    """)
+
+  def testDescriptorSelf(self):
+    ty = self.Infer("""
+      class Foo(object):
+        def __init__(self):
+          self._name = "name"
+        def __get__(self, obj, objtype):
+          return self._name
+      class Bar(object):
+        def test(self):
+          return self.foo
+        foo = Foo()
+    """)
+    self.assertTypesMatchPytd(ty, """
+      class Foo(object):
+        _name = ...  # type: str
+        def __get__(self, obj, objtype) -> str: ...
+      class Bar(object):
+        foo = ...  # type: str
+        def test(self) -> str: ...
+    """)
+
+  def testDescriptorInstance(self):
+    ty = self.Infer("""
+      class Foo(object):
+        def __get__(self, obj, objtype):
+          return obj._name
+      class Bar(object):
+        def __init__(self):
+          self._name = "name"
+        def test(self):
+          return self.foo
+        foo = Foo()
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Any
+      class Foo(object):
+        def __get__(self, obj, objtype) -> Any: ...
+      class Bar(object):
+        _name = ...  # type: str
+        foo = ...  # type: Any
+        def test(self) -> str: ...
+    """)
+
+  def testDescriptorClass(self):
+    ty = self.Infer("""
+      class Foo(object):
+        def __get__(self, obj, objtype):
+          return objtype._name
+      class Bar(object):
+        def test(self):
+          return self.foo
+        _name = "name"
+        foo = Foo()
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Any
+      class Foo(object):
+        def __get__(self, obj, objtype) -> Any: ...
+      class Bar(object):
+        _name = ...  # type: str
+        foo = ...  # type: Any
+        def test(self) -> str: ...
+    """)
+
+  def testBadDescriptor(self):
+    ty = self.Infer("""
+      class Foo(object):
+        __get__ = None
+      class Bar(object):
+        foo = Foo()
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Any
+      class Foo(object):
+        __get__ = ...  # type: None
+      class Bar(object):
+        foo = ...  # type: Any
+    """)
+
+  def testNotDescriptor(self):
+    ty = self.Infer("""
+      class Foo(object):
+        pass
+      foo = Foo()
+      foo.__get__ = None
+      class Bar(object):
+        foo = foo
+    """)
+    self.assertTypesMatchPytd(ty, """
+      class Foo(object):
+        __get__ = ...  # type: None
+      foo = ...  # type: Foo
+      class Bar(object):
+        foo = ...  # type: Foo
+    """)
+
+  def testGetAttr(self):
+    ty = self.Infer("""
+      class Foo(object):
+        def __getattr__(self, name):
+          return "attr"
+      def f():
+        return Foo().foo
+    """)
+    self.assertTypesMatchPytd(ty, """
+      class Foo(object):
+        def __getattr__(self, name) -> str: ...
+      def f() -> str: ...
+    """)
+
+  def testGetAttrPyi(self):
+    d = test_utils.pyi_dir("foo.pyi", """
+      class Foo(object):
+        def __getattr__(self, name) -> str
+    """)
+    ty = self.Infer("""
+      import foo
+      def f():
+        return foo.Foo().foo
+    """, pythonpath=[d])
+    self.assertTypesMatchPytd(ty, """
+      foo = ...  # type: module
+      def f() -> str
+    """)
+
+  def testGetAttribute(self):
+    ty = self.Infer("""
+      class A(object):
+        def __getattribute__(self, name):
+          return 42
+      x = A().x
+    """)
+    self.assertTypesMatchPytd(ty, """
+      class A(object):
+        def __getattribute__(self, name) -> int
+      x = ...  # type: int
+    """)
+
+  def testGetAttributePyi(self):
+    d = test_utils.pyi_dir("a.pyi", """
+      class A(object):
+        def __getattribute__(self, name) -> int
+    """)
+    ty = self.Infer("""
+      import a
+      x = a.A().x
+    """, pythonpath=[d])
+    self.assertTypesMatchPytd(ty, """
+      a = ...  # type: module
+      x = ...  # type: int
+    """)
+
+  def testInheritFromClassobj(self):
+    d = test_utils.pyi_dir("a.pyi", """
+      class A():
+        pass
+    """)
+    ty = self.Infer("""
+      import a
+      class C(a.A):
+        pass
+      name = C.__name__
+    """, pythonpath=[d])
+    self.assertTypesMatchPytd(ty, """
+      a = ... # type: module
+      class C(a.A):
+        pass
+      name = ... # type: str
+    """)
+
+  def testMetaclassGetAttribute(self):
+    d = test_utils.pyi_dir("enum.pyi", """
+      from typing import Any
+      class EnumMeta(type):
+        def __getattribute__(self, name) -> Any
+      class Enum(metaclass=EnumMeta): ...
+      class IntEnum(int, Enum): ...
+    """)
+    ty = self.Infer("""
+      import enum
+      class A(enum.Enum):
+        x = 1
+      class B(enum.IntEnum):
+        x = 1
+      enum1 = A.x
+      name1 = A.x.name
+      enum2 = B.x
+      name2 = B.x.name
+    """, deep=False, pythonpath=[d])
+    self.assertTypesMatchPytd(ty, """
+      from typing import Any
+      enum = ...  # type: module
+      class A(enum.Enum):
+        x = ...  # type: int
+      class B(enum.IntEnum):
+        x = ...  # type: int
+      enum1 = ...  # type: Any
+      name1 = ...  # type: Any
+      enum2 = ...  # type: Any
+      name2 = ...  # type: Any
+    """)
+
+  def testReturnClassType(self):
+    d = test_utils.pyi_dir("a.pyi", """
+      from typing import Type
+      class A(object):
+        x = ...  # type: int
+      class B(object):
+        x = ...  # type: str
+      def f(x: Type[A]) -> Type[A]
+      def g() -> Type[A or B]
+      def h() -> Type[int or B]
+    """)
+    ty = self.Infer("""
+      import a
+      x1 = a.f(a.A).x
+      x2 = a.g().x
+      x3 = a.h().x
+    """, pythonpath=[d])
+    self.assertTypesMatchPytd(ty, """
+      a = ...  # type: module
+      x1 = ...  # type: int
+      x2 = ...  # type: int or str
+      x3 = ...  # type: str
+    """)
+
+  def testCallClassType(self):
+    d = test_utils.pyi_dir("a.pyi", """
+      from typing import Type
+      class A(object): ...
+      class B(object):
+        MyA = ...  # type: Type[A]
+    """)
+    ty = self.Infer("""
+      import a
+      x = a.B.MyA()
+    """, pythonpath=[d])
+    self.assertTypesMatchPytd(ty, """
+      a = ...  # type: module
+      x = ...  # type: a.A
+    """)
+
+  def testCallAlias(self):
+    ty = self.Infer("""
+      class A: pass
+      B = A
+      x = B()
+    """, deep=False)
+    # We don't care whether the type of x is inferred as A or B, but we want it
+    # to always be the same.
+    self.assertTypesMatchPytd(ty, """
+      class A: ...
+      B = A
+      x = ...  # type: A
+    """)
+
+  def testNew(self):
+    d = test_utils.pyi_dir("a.pyi", """
+      class A(object):
+        def __new__(cls, x: int) -> B
+      class B: ...
+    """)
+    ty = self.Infer("""
+      import a
+      class C(object):
+        def __new__(cls):
+          return "hello world"
+      x1 = a.A(42)
+      x2 = C()
+      x3 = object.__new__(bool)
+    """, pythonpath=[d])
+    self.assertTypesMatchPytd(ty, """
+      a = ...  # type: module
+      class C(object):
+        def __new__(cls) -> str
+      x1 = ...  # type: a.B
+      x2 = ...  # type: str
+      x3 = ...  # type: bool
+    """)
+
+  def testNewAndInit(self):
+    ty = self.Infer("""
+      class A(object):
+        def __new__(cls, a, b):
+          return super(A, cls).__new__(cls, a, b)
+        def __init__(self, a, b):
+          self.x = a + b
+      class B(object):
+        def __new__(cls, x):
+          v = A(x, 0)
+          v.y = False
+          return v
+        # __init__ should not be called
+        def __init__(self, x):
+          pass
+      x1 = A("hello", "world")
+      x2 = x1.x
+      x3 = B(3.14)
+      x4 = x3.x
+      x5 = x3.y
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Any, Type, TypeVar
+      _TA = TypeVar("_TA", bound=A)
+      class A(object):
+        x = ...  # type: Any
+        y = ...  # type: bool
+        def __new__(cls: Type[_TA], a, b) -> _TA
+        def __init__(self, a, b) -> None
+      class B(object):
+        def __new__(cls, x) -> A
+        def __init__(self, x) -> None
+      x1 = ...  # type: A
+      x2 = ...  # type: str
+      x3 = ...  # type: A
+      x4 = ...  # type: float
+      x5 = ...  # type: bool
+    """)
+
+  def testNewAndInitPyi(self):
+    d = test_utils.pyi_dir("a.pyi", """
+      from typing import Generic, TypeVar
+      T = TypeVar("T")
+      N = TypeVar("N")
+      class A(Generic[T]):
+        def __new__(cls, x) -> A[nothing]
+        def __init__(self, x: N):
+          self = A[N]
+      class B(object):
+        def __new__(cls) -> A[str]
+        # __init__ should not be called
+        def __init__(self, x, y) -> None
+    """)
+    ty = self.Infer("""
+      import a
+      x1 = a.A(0)
+      x2 = a.B()
+    """, pythonpath=[d])
+    self.assertTypesMatchPytd(ty, """
+      a = ...  # type: module
+      x1 = ...  # type: a.A[int]
+      x2 = ...  # type: a.A[str]
+    """)
+
+
+test_base.main(globals(), __name__ == "__main__")
@@ -0,0 +1,746 @@
+"""Tests for classes.
+
+File 2/2. Split into parts to enable better test parallelism.
+"""
+
+from pytype import file_utils
+from pytype.pytd import pytd
+from pytype.tests import test_base
+from pytype.tests import test_utils
+
+
+class ClassesTest2(test_base.TargetIndependentTest):
+  """Tests for classes."""
+
+  def testGetType(self):
+    ty = self.Infer("""
+      class A:
+        x = 3
+      def f():
+        return A() if __random__ else ""
+      B = type(A())
+      C = type(f())
+      D = type(int)
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Type
+      class A:
+        x = ...  # type: int
+      def f() -> A or str
+      B = A
+      C = ...  # type: Type[A or str]
+      D = ...  # type: Type[type]
+    """)
+
+  def testTypeAttribute(self):
+    ty = self.Infer("""
+      class A:
+        x = 3
+      B = type(A())
+      x = B.x
+      mro = B.mro()
+    """)
+    self.assertTypesMatchPytd(ty, """
+      class A:
+        x = ...  # type: int
+      B = A
+      x = ...  # type: int
+      mro = ...  # type: list
+    """)
+
+  def testTypeSubclass(self):
+    ty = self.Infer("""
+      class A(type):
+        def __init__(self, name, bases, dict):
+          super(A, self).__init__(name, bases, dict)
+        def f(self):
+          return 3.14
+      Int = A(0)
+      X = A("X", (int, object), {"a": 1})
+      x = X()
+      a = X.a
+      v = X.f()
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Type
+      class A(type):
+        def __init__(self, name, bases, dict) -> None
+        def f(self) -> float
+      Int = ...  # type: Type[int]
+      class X(int, object, metaclass=A):
+        a = ...  # type: int
+      x = ...  # type: X
+      a = ...  # type: int
+      v = ...  # type: float
+    """)
+
+  def testUnionBaseClass(self):
+    self.Check("""\
+      import typing
+      class A(tuple): pass
+      class B(tuple): pass
+      class Foo(typing.Union[A,B]): pass
+      """)
+
+  def testMetaclassPyi(self):
+    d = test_utils.pyi_dir("a.pyi", """
+      class A(type):
+        def f(self) -> float
+      class X(metaclass=A): ...
+    """)
+    ty = self.Infer("""
+      import a
+      v = a.X.f()
+    """, pythonpath=[d])
+    self.assertTypesMatchPytd(ty, """
+      a = ...  # type: module
+      v = ...  # type: float
+    """)
+
+  def testUnsolvableMetaclass(self):
+    with file_utils.Tempdir() as d:
+      d.create_file("a.pyi", """
+        from typing import Any
+        def __getattr__(name) -> Any
+      """)
+      d.create_file("b.pyi", """
+        from a import A
+        class B(metaclass=A): ...
+      """)
+      ty = self.Infer("""
+        import b
+        x = b.B.x
+      """, pythonpath=[d.path])
+      self.assertTypesMatchPytd(ty, """
+        from typing import Any
+        b = ...  # type: module
+        x = ...  # type: Any
+      """)
+
+  def testMakeType(self):
+    ty = self.Infer("""
+      X = type("X", (int, object), {"a": 1})
+      x = X()
+      a = X.a
+    """)
+    self.assertTypesMatchPytd(ty, """
+      class X(int, object):
+        a = ...  # type: int
+      x = ...  # type: X
+      a = ...  # type: int
+    """)
+
+  def testMakeSimpleType(self):
+    ty = self.Infer("""
+      X = type("X", (), {})
+      x = X()
+    """)
+    self.assertTypesMatchPytd(ty, """
+      class X(object): ...
+      x = ...  # type: X
+    """)
+
+  def testMakeAmbiguousType(self):
+    ty = self.Infer("""
+      if __random__:
+        name = "A"
+      else:
+        name = "B"
+      X = type(name, (int, object), {"a": 1})
+      x = X()
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Any
+      name = ...  # type: str
+      X = ...  # type: Any
+      x = ...  # type: Any
+    """)
+
+  def testTypeInit(self):
+    ty = self.Infer("""
+      import six
+      class A(type):
+        def __init__(self, name, bases, members):
+          self.x = 42
+          super(A, self).__init__(name, bases, members)
+      B = A("B", (), {})
+      class C(six.with_metaclass(A, object)):
+        pass
+      x1 = B.x
+      x2 = C.x
+    """)
+    self.assertTypesMatchPytd(ty, """
+      six: module
+      class A(type):
+        x: int
+        def __init__(self, name, bases, members) -> None
+      class B(object, metaclass=A):
+        x: int
+      class C(object, metaclass=A):
+        x: int
+      x1: int
+      x2: int
+    """)
+
+  def testSetMetaclass(self):
+    ty = self.Infer("""
+      class A(type):
+        def f(self):
+          return 3.14
+      class X(object):
+        __metaclass__ = A
+      v = X.f()
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Type
+      class A(type):
+        def f(self) -> float
+      class X(object, metaclass=A):
+        __metaclass__ = ...  # type: Type[A]
+      v = ...  # type: float
+    """)
+
+  def testNoMetaclass(self):
+    # In both of these cases, the metaclass should not actually be set.
+    ty = self.Infer("""
+      class A(type): pass
+      X1 = type("X1", (), {"__metaclass__": A})
+      class X2(object):
+        __metaclass__ = type
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Type
+      class A(type): ...
+      class X1(object):
+        __metaclass__ = ...  # type: Type[A]
+      class X2(object):
+        __metaclass__ = ...  # type: Type[type]
+    """)
+
+  def testMetaclass(self):
+    d = test_utils.pyi_dir("foo.pyi", """
+      T = TypeVar("T")
+      class MyMeta(type):
+        def register(self, cls: type) -> None
+      def mymethod(funcobj: T) -> T
+    """)
+    ty = self.Infer("""
+      import foo
+      class X(object):
+        __metaclass__ = foo.MyMeta
+        @foo.mymethod
+        def f(self):
+          return 42
+      X.register(tuple)
+      v = X().f()
+    """, pythonpath=[d])
+    self.assertTypesMatchPytd(ty, """
+      from typing import Type
+      foo = ...  # type: module
+      class X(object, metaclass=foo.MyMeta):
+        __metaclass__ = ...  # type: Type[foo.MyMeta]
+        def f(self) -> int
+      v = ...  # type: int
+    """)
+
+  @test_base.skip("Setting __metaclass__ to a function doesn't work yet.")
+  def testFunctionAsMetaclass(self):
+    ty = self.Infer("""
+      def MyMeta(name, bases, members):
+        return type(name, bases, members)
+      class X(object):
+        __metaclass__ = MyMeta
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Any
+      def MyMeta(names, bases, members) -> Any
+      class X(object, metaclass=MyMeta):
+        def __metaclass__(names, bases, members) -> Any
+    """)
+
+  def testBadMroParameterizedClass(self):
+    d = test_utils.pyi_dir("foo.pyi", """
+      from typing import Generic, TypeVar
+      T = TypeVar("T")
+      class A(Generic[T]): ...
+      class B(A[T]): ...
+      class C(A[T], B[T]): ...
+      def f() -> C[int]: ...
+    """)
+    _, errors = self.InferWithErrors("""\
+      import foo
+      foo.f()
+    """, pythonpath=[d])
+    self.assertErrorLogIs(errors, [(2, "mro-error", r"C")])
+
+  def testCallParameterizedClass(self):
+    _, errors = self.InferWithErrors("""\
+      from typing import List
+      List[str]()
+      """)
+    self.assertErrorLogIs(errors, [(2, "not-callable")])
+
+  def testErrorfulConstructors(self):
+    ty, errors = self.InferWithErrors("""\
+      class Foo(object):
+        attr = 42
+        def __new__(cls):
+          return name_error
+        def __init__(self):
+          self.attribute_error
+          self.instance_attr = self.attr
+        def f(self):
+          return self.instance_attr
+    """, deep=True)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Any
+      class Foo(object):
+        attr = ...  # type: int
+        instance_attr = ...  # type: int
+        def __new__(cls) -> Any: ...
+        def f(self) -> int: ...
+    """)
+    self.assertErrorLogIs(errors, [(4, "name-error"), (6, "attribute-error")])
+
+  def testNewFalse(self):
+    ty = self.Infer("""\
+      class Foo(object):
+        def __new__(cls):
+          return False
+        def __init__(self):
+          self.instance_attr = ""
+        def f(self):
+          return self.instance_attr
+    """)
+    self.assertTypesMatchPytd(ty, """
+      class Foo(object):
+        instance_attr = ...  # type: str
+        def __new__(cls) -> bool: ...
+        def f(self) -> str: ...
+    """)
+
+  def testNewAmbiguous(self):
+    ty = self.Infer("""\
+      class Foo(object):
+        def __new__(cls):
+          if __random__:
+            return super(Foo, cls).__new__(cls)
+          else:
+            return "hello world"
+        def __init__(self):
+          self.instance_attr = ""
+        def f(self):
+          return self.instance_attr
+    """)
+    self.assertTypesMatchPytd(ty, """
+      class Foo(object):
+        instance_attr = ...  # type: str
+        def __new__(cls) -> str or Foo
+        def f(self) -> str
+    """)
+
+  def testNewExtraArg(self):
+    self.Check("""
+      class Foo(object):
+        def __new__(cls, _):
+          return super(Foo, cls).__new__(cls)
+      Foo("Foo")
+    """)
+
+  def testNewExtraNoneReturn(self):
+    ty = self.Infer("""
+      class Foo(object):
+        def __new__(cls):
+          if __random__:
+            return super(Foo, cls).__new__(cls)
+        def foo(self):
+          return self
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import TypeVar
+      _TFoo = TypeVar("_TFoo", bound=Foo)
+      class Foo(object):
+        def __new__(cls) -> Foo or None
+        def foo(self: _TFoo) -> _TFoo
+    """)
+
+  def testSuperNewExtraArg(self):
+    self.Check("""
+      class Foo(object):
+        def __init__(self, x):
+          pass
+        def __new__(cls, x):
+          # The extra arg is okay because __init__ is defined.
+          return super(Foo, cls).__new__(cls, x)
+    """)
+
+  def testSuperInitExtraArg(self):
+    self.Check("""
+      class Foo(object):
+        def __init__(self, x):
+          # The extra arg is okay because __new__ is defined.
+          super(Foo, self).__init__(x)
+        def __new__(cls, x):
+          return super(Foo, cls).__new__(cls)
+    """)
+
+  def testSuperInitExtraArg2(self):
+    d = test_utils.pyi_dir("foo.pyi", """
+      class Foo(object):
+        def __new__(cls, a, b) -> Foo
+    """)
+    self.Check("""
+      import foo
+      class Bar(foo.Foo):
+        def __init__(self, a, b):
+          # The extra args are okay because __new__ is defined on Foo.
+          super(Bar, self).__init__(a, b)
+    """, pythonpath=[d])
+
+  def testSuperNewWrongArgCount(self):
+    _, errors = self.InferWithErrors("""\
+      class Foo(object):
+        def __new__(cls, x):
+          return super(Foo, cls).__new__(cls, x)
+    """, deep=True)
+    self.assertErrorLogIs(errors, [(3, "wrong-arg-count", "1.*2")])
+
+  def testSuperInitWrongArgCount(self):
+    _, errors = self.InferWithErrors("""\
+      class Foo(object):
+        def __init__(self, x):
+          super(Foo, self).__init__(x)
+    """, deep=True)
+    self.assertErrorLogIs(errors, [(3, "wrong-arg-count", "1.*2")])
+
+  def testSuperNewMissingParameter(self):
+    _, errors = self.InferWithErrors("""\
+      class Foo(object):
+        def __new__(cls, x):
+          # Even when __init__ is defined, too few args is an error.
+          return super(Foo, cls).__new__()
+        def __init__(self, x):
+          pass
+    """, deep=True)
+    self.assertErrorLogIs(errors, [(4, "missing-parameter", r"cls.*__new__")])
+
+  def testNewKwarg(self):
+    _, errors = self.InferWithErrors("""\
+      class Foo(object):
+        def __new__(cls):
+          # ok because __init__ is defined.
+          return super(Foo, cls).__new__(cls, x=42)
+        def __init__(self):
+          pass
+      class Bar(object):
+        def __new__(cls):
+          return super(Bar, cls).__new__(cls, x=42)  # bad!
+    """, deep=True)
+    self.assertErrorLogIs(errors, [(9, "wrong-keyword-args", r"x.*__new__")])
+
+  def testInitKwarg(self):
+    _, errors = self.InferWithErrors("""\
+      class Foo(object):
+        def __init__(self):
+          # ok because __new__ is defined.
+          super(Foo, self).__init__(x=42)
+        def __new__(cls):
+          return super(Foo, cls).__new__(cls)
+      class Bar(object):
+        def __init__(self):
+          super(Bar, self).__init__(x=42)  # bad!
+    """, deep=True)
+    self.assertErrorLogIs(errors, [(9, "wrong-keyword-args", r"x.*__init__")])
+
+  def testAliasInnerClass(self):
+    ty = self.Infer("""
+      def f():
+        class Bar(object):
+          def __new__(cls, _):
+            return super(Bar, cls).__new__(cls)
+        return Bar
+      Baz = f()
+    """)
+    self.assertTypesMatchPytd(ty, """
+      from typing import Type, TypeVar
+      def f() -> Type[Baz]
+      _TBaz = TypeVar("_TBaz", bound=Baz)
+      class Baz(object):
+        def __new__(cls: Type[_TBaz], _) -> _TBaz
+    """)
+
+  def testModuleInClassDefinitionScope(self):
+    d = test_utils.pyi_dir("foo.pyi", """
+      class Bar: ...
+    """)
+    self.Check("""
+      import foo
+      class ConstStr(str):
+        foo.Bar # testing that this does not affect inference.
+        def __new__(cls, x):
+          obj = super(ConstStr, cls).__new__(cls, x)
+          return obj
+    """, pythonpath=[d])
+
+  def testInitWithNoParams(self):
+    self.Check("""\
+      class Foo(object):
+        def __init__():
+          pass
+      """)
+
+  def testInstantiateWithAbstractDict(self):
+    ty = self.Infer("""
+      X = type("", (), dict())
+    """, deep=False)
+    self.assertTypesMatchPytd(ty, """
+      X = ...  # type: ?
+    """)
+
+  def testNotInstantiable(self):
+    errors = self.CheckWithErrors("""\
+      class Foo(object):
+        def __new__(cls):
+          assert cls is not Foo, "not instantiable"
+        def foo(self):
+          name_error
+    """)
+    self.assertErrorLogIs(errors, [(5, "name-error")])
+
+  def testUnknownMetaclass(self):
+    self.Check("""
+      class Foo(object):
+        __metaclass__ = __any_object__
+        def foo(self):
+          self.bar()
+        @classmethod
+        def bar(cls):
+          pass
+    """)
+
+  def testMetaclassOnUnknownClass(self):
+    self.Check("""
+      import six
+      class Foo(type):
+        pass
+      def decorate(cls):
+        return __any_object__
+      @six.add_metaclass(Foo)
+      @decorate
+      class Bar(object):
+        pass
+    """)
+
+  def testSubclassContainsBase(self):
+    ty = self.Infer("""\
+      def get_c():
+        class C(object):
+          def __init__(self, z):
+            self.a = 3
+            self.c = z
+          def baz(self): pass
+        return C
+      class DC(get_c()):
+        def __init__(self, z):
+          super(DC, self).__init__(z)
+          self.b = "hello"
+        def bar(self, x): pass
+      x = DC(1)
+    """)
+    self.assertTypesMatchPytd(ty, """\
+      from typing import Any
+      class DC(object):
+          a = ...  # type: int
+          b = ...  # type: str
+          c = ...  # type: Any
+          def __init__(self, z) -> None: ...
+          def bar(self, x) -> None: ...
+          def baz(self) -> None: ...
+      def get_c() -> type: ...
+      x = ...  # type: DC
+    """)
+
+  def testSubclassMultipleBaseOptions(self):
+    ty = self.Infer("""\
+      class A(object): pass
+      def get_base():
+        class B(object): pass
+        return B
+      Base = A if __random__ else get_base()
+      class C(Base): pass
+    """)
+    self.assertTypesMatchPytd(ty, """\
+      from typing import Any, Union
+      def get_base() -> type: ...
+      class A(object): pass
+      Base = ...  # type: type
+      class C(Any): pass
+    """)
+
+  def testSubclassContainsGenericBase(self):
+    ty = self.Infer("""\
+      import typing
+      def get_base():
+        class C(typing.List[str]):
+          def get_len(self): return len(self)
+        return C
+      class DL(get_base()): pass
+    """)
+    self.assertTypesMatchPytd(ty, """\
+      from typing import List
+      typing = ...  # type: module
+      class DL(List[str]):
+          def get_len(self) -> int: ...
+      def get_base() -> type: ...
+    """)
+
+  def testSubclassOverridesBaseAttributes(self):
+    ty = self.Infer("""\
+      def get_base():
+        class B(object):
+          def __init__(self):
+            self.a = 1
+            self.b = 2
+          def bar(self, x): pass
+          def baz(self): pass
+        return B
+      class C(get_base()):
+        def __init__(self):
+          super(C, self).__init__()
+          self.b = "hello"
+          self.c = "world"
+        def bar(self, x): pass
+    """)
+    self.assertTypesMatchPytd(ty, """\
+      def get_base() -> type: ...
+      class C(object):
+        a = ...  # type: int
+        b = ...  # type: str
+        c = ...  # type: str
+        def bar(self, x) -> None: ...
+        def baz(self) -> None: ...
+    """)
+
+  def testSubclassMakeBase(self):
+    ty = self.Infer("""
+      def make_base(x):
+        class C(x):
+          def __init__(self):
+            self.x = 1
+        return C
+      class BX(make_base(list)): pass
+    """)
+    self.assertTypesMatchPytd(ty, """\
+      def make_base(x) -> type: ...
+      class BX(list):
+        x = ...  # type: int
+    """)
+
+  def testSubclassBasesOverlap(self):
+    ty = self.Infer("""\
+      def make_a():
+        class A(object):
+          def __init__(self):
+            self.x = 1
+        return A
+      def make_b():
+        class B(object):
+          def __init__(self):
+            self.x = "hello"
+        return B
+      class C(make_a(), make_b()):
+        pass
+    """)
+    self.assertTypesMatchPytd(ty, """
+      def make_a() -> type: ...
+      def make_b() -> type: ...
+      class C(object):
+        x = ...  # type: int
+    """)
+
+  def testPyiNestedClass(self):
+    # Test that pytype can look up a pyi nested class in a py file and reconsume
+    # the inferred pyi.
+    with file_utils.Tempdir() as d:
+      d.create_file("foo.pyi", """
+        class X:
+          class Y: ...
+      """)
+      ty = self.Infer("""
+        import foo
+        Y = foo.X.Y
+      """, pythonpath=[d.path])
+      self.assertTypesMatchPytd(ty, """
+        from typing import Type
+        import foo
+        foo: module
+        Y: Type[foo.X.Y]
+      """)
+      d.create_file("bar.pyi", pytd.Print(ty))
+      ty = self.Infer("""
+        import bar
+        Y = bar.Y
+      """, pythonpath=[d.path])
+      self.assertTypesMatchPytd(ty, """
+        from typing import Type
+        import foo
+        bar: module
+        Y: Type[foo.X.Y]
+      """)
+
+  def testPyiNestedClassAlias(self):
+    d = test_utils.pyi_dir("foo.pyi", """
+      class X:
+        class Y: ...
+        Z = X.Y
+    """)
+    ty = self.Infer("""
+      import foo
+      Z = foo.X.Z
+    """, pythonpath=[d])
+    self.assertTypesMatchPytd(ty, """
+      from typing import Type
+      import foo
+      foo: module
+      Z: Type[foo.X.Y]
+    """)
+
+  def testPyiDeeplyNestedClass(self):
+    d = test_utils.pyi_dir("foo.pyi", """
+      class X:
+        class Y:
+          class Z: ...
+    """)
+    ty = self.Infer("""
+      import foo
+      Z = foo.X.Y.Z
+    """, pythonpath=[d])
+    self.assertTypesMatchPytd(ty, """
+      from typing import Type
+      import foo
+      foo: module
+      Z: Type[foo.X.Y.Z]
+    """)
+
+  def testLateAnnotation(self):
+    ty = self.Infer("""
+      class Foo(object):
+        bar = None  # type: 'Bar'
+      class Bar(object):
+        def __init__(self):
+          self.x = 0
+      class Baz(Foo):
+        def f(self):
+          return self.bar.x
+    """)
+    self.assertTypesMatchPytd(ty, """
+      class Foo(object):
+        bar: Bar
+      class Bar(object):
+        x: int
+      class Baz(Foo):
+        def f(self) -> int: ...
+    """)
+
+
+test_base.main(globals(), __name__ == "__main__")
@@ -0,0 +1,66 @@
+"""Tests for the on-disk cache of BaseTest.Infer."""
+
+import os
+
+from pytype import file_utils
+from pytype.tests import test_base
+
+
+class InferDiskCacheTest(test_base.TargetIndependentTest):
+  """Tests for the on-disk cache of BaseTest.Infer."""
+
+  def setUp(self):
+    super(InferDiskCacheTest, self).setUp()
+    self._old_disk_cache_dir = test_base._DISK_CACHE_DIR
+    # Results in the in-memory cache would never reach the disk cache.
+    test_base._INFER_CACHE.clear()
+
+  def tearDown(self):
+    test_base._DISK_CACHE_DIR = self._old_disk_cache_dir
+    super(InferDiskCacheTest, self).tearDown()
+
+  def _InferFromDiskCache(self, *args, **kwargs):
+    def InferAndVerify(*unused_args, **unused_kwargs):
+      self.fail("Result was not loaded from the disk cache")
+    self._InferAndVerify = InferAndVerify
+    # The in-memory cache is checked first, so empty it to reach the disk.
+    test_base._INFER_CACHE.clear()
+    try:
+      return self.Infer(*args, **kwargs)
+    finally:
+      del self._InferAndVerify
+
+  def testCacheHit(self):
+    src = """
+      class Foo(object):
+        def __init__(self, x):
+          self.x = [x, len(x)]
+      def f(x):
+        return Foo(x).x
+    """
+    with file_utils.Tempdir() as d:
+      test_base._DISK_CACHE_DIR = d.path
+      ty = self.Infer(src)
+      self.assertEqual(len(os.listdir(test_base._GetDiskCacheSubdir())), 1)
+      cached_ty = self._InferFromDiskCache(src)
+      self.assertTrue(cached_ty.ASTeq(ty))
+
+  def testStaleEntries(self):
+    with file_utils.Tempdir() as d:
+      stale_dir = d.create_directory(os.path.join("pytype_infer", "0" * 64))
+      other_dirs = [d.create_directory("other"),
+                    d.create_directory(os.path.join("pytype_infer", "other"))]
+      test_base._DISK_CACHE_DIR = d.path
+      self.Infer("x = 42")
+      self.assertFalse(os.path.exists(stale_dir))
+      for other_dir in other_dirs:
+        self.assertTrue(os.path.isdir(other_dir))
+
+  def testInitModule(self):
+    with file_utils.Tempdir() as d:
+      test_base._DISK_CACHE_DIR = d.path
+      self.Infer("x = 42", module_name="foo.__init__")
+      self.assertFalse(os.path.exists(test_base._GetDiskCacheSubdir()))
+
+
+test_base.main(globals(), __name__ == "__main__")
@@ -1,9 +1,13 @@
 """Utility class and function for tests."""
 
+import atexit
 import collections
+import hashlib
+import os
 import subprocess
 
 from pytype import compat
+from pytype import file_utils
 from pytype import state as frame_state
 from pytype.pyc import loadmarshal
 
@@ -30,6 +34,36 @@ def fake_stack(length):
           for i in range(length)]
 
 
+# Per-process temporary directory holding the stubs created by pyi_dir().
+_pyi_tmpdir = None
+
+
+def pyi_dir(filename, contents):
+  """Create a stub in a temporary directory shared by all tests.
+
+  Each (filename, contents) pair gets its own subdirectory, named after a hash
+  of the pair, so that tests can't see each other's stubs and a stub is only
+  written once. The shared directory is created lazily, so every test process
+  gets its own, and removed when the process exits.
+
+  Args:
+    filename: The name of the stub, e.g. "a.pyi".
+    contents: The (possibly indented) contents of the stub.
+
+  Returns:
+    The directory containing the stub, for use as a pythonpath entry.
+  """
+  global _pyi_tmpdir
+  if _pyi_tmpdir is None:
+    _pyi_tmpdir = file_utils.Tempdir().__enter__()
+    atexit.register(_pyi_tmpdir.__exit__, None, None, None)
+  key = hashlib.sha1((filename + "\0" + contents).encode("utf-8"))
+  path = os.path.join(key.hexdigest(), filename)
+  if not os.path.exists(_pyi_tmpdir[path]):
+    _pyi_tmpdir.create_file(path, contents)
+  return _pyi_tmpdir[key.hexdigest()]
+
+
 class OperatorsTestMixin(object):
   """Mixin providing utilities for operators tests."""
 